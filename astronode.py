@@ -9,10 +9,17 @@ if is_micropython:
     import ubinascii as binascii
     import utime as time
     import ustruct as struct
+    from micropython import const
 
     def now_ms():
         return time.ticks_ms()
 
+    def ticks_add(ticks, delta):
+        return time.ticks_add(ticks, delta)
+
+    def ticks_diff(ticks1, ticks2):
+        return time.ticks_diff(ticks1, ticks2)
+
     def sleep_ms(mills):
         time.sleep_ms(mills)
 else:
@@ -20,184 +27,467 @@ else:
     import time
     import struct
 
+    def const(value):
+        return value
+
     def now_ms():
         return int(time.time() * 1000)
 
+    def ticks_add(ticks, delta):
+        return ticks + delta
+
+    def ticks_diff(ticks1, ticks2):
+        return ticks1 - ticks2
+
     def sleep_ms(mills):
         time.sleep(mills/1000)
 
 import random
 
-TIMEOUT_SERIAL = 1500 # ms
-BOOT_TIME = 400       # ms
+TIMEOUT_SERIAL = const(1500) # ms
+BOOT_TIME = const(400)       # ms
 
 # REQUEST (Asset => Terminal)
-CFG_WR = 0x05 # Write configuration, and store in non-volatile memory
-WIF_WR = 0x06 # Write Wi-Fi settings, and store non-volatile memory (Wi-Fi only)
-SSC_WR = 0x07 # Satellite Search Configuration Write Request. Stored in RAM (never saved in NVM).
-CFG_SR = 0x10 # Save configuration in NVM request
-CFG_FR = 0x11 # Factory reset configuration request
-CFG_RR = 0x15 # Read configuration from non-volatile memory
-RTC_RR = 0x17 # Real Time Clock read request
-NCO_RR = 0x18 # Next Contact Opportunity read request
-MGI_RR = 0x19 # Module GUID read request
-MSN_RR = 0x1A # Module Serial Number read request
-MPN_RR = 0x1B # Module Product Number read request
-PLD_ER = 0x25 # Enqueue uplink payload in non-volatile memory
-PLD_DR = 0x26 # Dequeue uplink payload from non-volatile memory
-PLD_FR = 0x27 # Clear (Free) all queued payloads from non-volatile memory
-GEO_WR = 0x35 # Write geolocation longitude and latitude, and store in non-volatile memory
-SAK_RR = 0x45 # Read Acknowledgment
-SAK_CR = 0x46 # Confirm to the terminal that Acknowledgment was properly decoded and can be deleted by the terminal
-CMD_RR = 0x47 # Read a command message
-CMD_CR = 0x48 # Confirm to the module that the command was properly decoded and can be deleted by the module
-RES_CR = 0x55 # Clear reset event
-TTX_SR = 0x61 # Test Transmit Start Request
-EVT_RR = 0x65 # Reads the event register
-CTX_SR = 0x66 # Context Save Request - recommended before cutting power
-PER_RR = 0x67 # Performance Counter Read Request
-PER_CR = 0x68 # Performance Counter Clear Request
-MST_RR = 0x69 # Module State Read Request
-LCD_RR = 0x6A # Last Contact Details Read Request
-END_RR = 0x6B # Environment Details Read Request to evaluate RF environment
+CFG_WR = const(0x05) # Write configuration, and store in non-volatile memory
+WIF_WR = const(0x06) # Write Wi-Fi settings, and store non-volatile memory (Wi-Fi only)
+SSC_WR = const(0x07) # Satellite Search Configuration Write Request. Stored in RAM (never saved in NVM).
+CFG_SR = const(0x10) # Save configuration in NVM request
+CFG_FR = const(0x11) # Factory reset configuration request
+CFG_RR = const(0x15) # Read configuration from non-volatile memory
+RTC_RR = const(0x17) # Real Time Clock read request
+NCO_RR = const(0x18) # Next Contact Opportunity read request
+MGI_RR = const(0x19) # Module GUID read request
+MSN_RR = const(0x1A) # Module Serial Number read request
+MPN_RR = const(0x1B) # Module Product Number read request
+PLD_ER = const(0x25) # Enqueue uplink payload in non-volatile memory
+PLD_DR = const(0x26) # Dequeue uplink payload from non-volatile memory
+PLD_FR = const(0x27) # Clear (Free) all queued payloads from non-volatile memory
+GEO_WR = const(0x35) # Write geolocation longitude and latitude, and store in non-volatile memory
+SAK_RR = const(0x45) # Read Acknowledgment
+SAK_CR = const(0x46) # Confirm to the terminal that Acknowledgment was properly decoded and can be deleted by the terminal
+CMD_RR = const(0x47) # Read a command message
+CMD_CR = const(0x48) # Confirm to the module that the command was properly decoded and can be deleted by the module
+RES_CR = const(0x55) # Clear reset event
+TTX_SR = const(0x61) # Test Transmit Start Request
+EVT_RR = const(0x65) # Reads the event register
+CTX_SR = const(0x66) # Context Save Request - recommended before cutting power
+PER_RR = const(0x67) # Performance Counter Read Request
+PER_CR = const(0x68) # Performance Counter Clear Request
+MST_RR = const(0x69) # Module State Read Request
+LCD_RR = const(0x6A) # Last Contact Details Read Request
+END_RR = const(0x6B) # Environment Details Read Request to evaluate RF environment
 
 # ANSWER (Terminal => Asset)
-CFG_WA = 0x85 # Answer last configuration write operation with status
-WIF_WA = 0x86 # Answer last Wi-Fi settings write operation with status (Wi-Fi only)
-SSC_WA = 0x87 # Answer last Satellite Search Configuration write operation
-CFG_SA = 0x90 # Answer last configuration save requests with status
-CFG_FA = 0x91 # Answer last factory reset request with status
-CFG_RA = 0x95 # Answer last configuration read operation with value
-RTC_RA = 0x97 # Answer last RTC read request with module time
-NCO_RA = 0x98 # Answer with the time to the next contact opportunity
-MGI_RA = 0x99 # Answer last GUID read with module GUID
-MSN_RA = 0x9A # Answer last Serial Number read with module Serial Number
-MPN_RA = 0x9B # Answer last Module Product Number read with the Product Number
-PLD_EA = 0xA5 # Answer last uplink payload enqueue operation with status
-PLD_DA = 0xA6 # Answer last uplink payload dequeue operation with status
-PLD_FA = 0xA7 # Answer last free queued payloads operation with status
-GEO_WA = 0xB5 # Answer last geolocation write operation with status
-SAK_RA = 0xC5 # Answer with Acknowledgment information
-SAK_CA = 0xC6 # Answer last SAK_CR confirmation
-CMD_RA = 0xC7 # Answer last CMD_RR with command data
-CMD_CA = 0xC8 # Answer last CMD_CR
-RES_CA = 0xD5 # Answer the reset clear request
-EVT_RA = 0xE5 # Answer indicates which events are currently pending
-CTX_SA = 0xE6 # Answer confirming Context Save Request
-PER_RA = 0xE7 # Answer with Performance Counters in Type, Length, Value format
-PER_CA = 0xE8 # Answer confirming Performance Counter Clear Request
-MST_RA = 0xE9 # Answer with details of the current Module State
-LCD_RA = 0xEA # Answer with details of the Last Contact
-END_RA = 0xEB # Answer with details of the RF environment
-ERR_RA = 0xFF # Answer a request reporting an error
+CFG_WA = const(0x85) # Answer last configuration write operation with status
+WIF_WA = const(0x86) # Answer last Wi-Fi settings write operation with status (Wi-Fi only)
+SSC_WA = const(0x87) # Answer last Satellite Search Configuration write operation
+CFG_SA = const(0x90) # Answer last configuration save requests with status
+CFG_FA = const(0x91) # Answer last factory reset request with status
+CFG_RA = const(0x95) # Answer last configuration read operation with value
+RTC_RA = const(0x97) # Answer last RTC read request with module time
+NCO_RA = const(0x98) # Answer with the time to the next contact opportunity
+MGI_RA = const(0x99) # Answer last GUID read with module GUID
+MSN_RA = const(0x9A) # Answer last Serial Number read with module Serial Number
+MPN_RA = const(0x9B) # Answer last Module Product Number read with the Product Number
+PLD_EA = const(0xA5) # Answer last uplink payload enqueue operation with status
+PLD_DA = const(0xA6) # Answer last uplink payload dequeue operation with status
+PLD_FA = const(0xA7) # Answer last free queued payloads operation with status
+GEO_WA = const(0xB5) # Answer last geolocation write operation with status
+SAK_RA = const(0xC5) # Answer with Acknowledgment information
+SAK_CA = const(0xC6) # Answer last SAK_CR confirmation
+CMD_RA = const(0xC7) # Answer last CMD_RR with command data
+CMD_CA = const(0xC8) # Answer last CMD_CR
+RES_CA = const(0xD5) # Answer the reset clear request
+EVT_RA = const(0xE5) # Answer indicates which events are currently pending
+CTX_SA = const(0xE6) # Answer confirming Context Save Request
+PER_RA = const(0xE7) # Answer with Performance Counters in Type, Length, Value format
+PER_CA = const(0xE8) # Answer confirming Performance Counter Clear Request
+MST_RA = const(0xE9) # Answer with details of the current Module State
+LCD_RA = const(0xEA) # Answer with details of the Last Contact
+END_RA = const(0xEB) # Answer with details of the RF environment
+ERR_RA = const(0xFF) # Answer a request reporting an error
 
 # Escape characters
 STX = b'\x02'
 ETX = b'\x03'
 
 # Command/Response size
-COMMAND_MAX_SIZE = 200
+COMMAND_MAX_SIZE = const(200)
 
 # Message queue description
-ASN_MAX_MSG_SIZE = 160
-ASN_MSG_QUEUE_SIZE = 8
+ASN_MAX_MSG_SIZE = const(160)
+ASN_MSG_QUEUE_SIZE = const(8)
 
 # Functions return codes
-ANS_STATUS_NONE = 0x0
-ANS_STATUS_CRC_NOT_VALID = 0x0001        # Discrepancy between provided CRC and expected CRC.
-ANS_STATUS_LENGTH_NOT_VALID = 0x0011,    # Message exceeds the maximum length for a frame.
-ANS_STATUS_OPCODE_NOT_VALID = 0x0121     # Invalid Operation Code used.
-ANS_STATUS_ARG_NOT_VALID = 0x0122        # Invalid argument used.
-ANS_STATUS_FLASH_WRITING_FAILED = 0x0123 # Failed to write to the flash.
-ANS_STATUS_DEVICE_BUSY = 0x0124          # Device is busy.
-ANS_STATUS_FORMAT_NOT_VALID = 0x0601     # At least one of the fields (SSID, password, token) is not composed of exclusively printable standard ASCII characters (0x20 to 0x7E).
-ANS_STATUS_PERIOD_INVALID = 0x0701       # The Satellite Search Config period enumeration value is not valid
-ANS_STATUS_BUFFER_FULL = 0x2501          # Failed to queue the payload because the sending queue is already full
-ANS_STATUS_DUPLICATE_ID = 0x2511         # Failed to queue the payload because the Payload ID provided by the asset is already in use in the terminal queue.
-ANS_STATUS_BUFFER_EMPTY = 0x2601         # Failed to dequeue a payload from the buffer because the buffer is empty
-ANS_STATUS_INVALID_POS = 0x3501          # Failed to update the geolocation information. Latitude and longitude fields must in the range [-90,90] degrees and [-180,180] degrees, respectively.
-ANS_STATUS_NO_ACK = 0x4501               # No satellite acknowledgement available for any payload.
-ANS_STATUS_NO_ACK_CLEAR = 0x4601         # No payload ack to clear, or it was already cleared.
-ANS_STATUS_NO_COMMAND = 0x4701           # No command is available.
-ANS_STATUS_NO_COMMAND_CLEAR = 0x4801     # No command to clear, or it was already cleared.
-ANS_STATUS_MAX_TX_REACHED = 0x6101       # Failed to test Tx due to the maximum number of transmissions being reached.
-ANS_STATUS_SUCCESS = 0x7000
-ANS_STATUS_TIMEOUT = 0x7001
-ANS_STATUS_HW_ERR = 0x7002
-ANS_STATUS_DATA_SENT = 0x7003
-ANS_STATUS_DATA_RECEIVED = 0x7004
-ANS_STATUS_PAYLOAD_TOO_LONG = 0x7005
-ANS_STATUS_PAYLOAD_ID_CHECK_FAILED = 0x7006
-ANS_STATUS_COMMAND_LENGTH_INVALID = 0x7007  # Downlink command length is neither 8 nor 40 bytes.
+ANS_STATUS_NONE = const(0x0)
+ANS_STATUS_CRC_NOT_VALID = const(0x0001)        # Discrepancy between provided CRC and expected CRC.
+ANS_STATUS_LENGTH_NOT_VALID = const(0x0011)     # Message exceeds the maximum length for a frame.
+ANS_STATUS_OPCODE_NOT_VALID = const(0x0121)     # Invalid Operation Code used.
+ANS_STATUS_ARG_NOT_VALID = const(0x0122)        # Invalid argument used.
+ANS_STATUS_FLASH_WRITING_FAILED = const(0x0123) # Failed to write to the flash.
+ANS_STATUS_DEVICE_BUSY = const(0x0124)          # Device is busy.
+ANS_STATUS_FORMAT_NOT_VALID = const(0x0601)     # At least one of the fields (SSID, password, token) is not composed of exclusively printable standard ASCII characters (0x20 to 0x7E).
+ANS_STATUS_PERIOD_INVALID = const(0x0701)       # The Satellite Search Config period enumeration value is not valid
+ANS_STATUS_BUFFER_FULL = const(0x2501)          # Failed to queue the payload because the sending queue is already full
+ANS_STATUS_DUPLICATE_ID = const(0x2511)         # Failed to queue the payload because the Payload ID provided by the asset is already in use in the terminal queue.
+ANS_STATUS_BUFFER_EMPTY = const(0x2601)         # Failed to dequeue a payload from the buffer because the buffer is empty
+ANS_STATUS_INVALID_POS = const(0x3501)          # Failed to update the geolocation information. Latitude and longitude fields must in the range [-90,90] degrees and [-180,180] degrees, respectively.
+ANS_STATUS_NO_ACK = const(0x4501)               # No satellite acknowledgement available for any payload.
+ANS_STATUS_NO_ACK_CLEAR = const(0x4601)         # No payload ack to clear, or it was already cleared.
+ANS_STATUS_NO_COMMAND = const(0x4701)           # No command is available.
+ANS_STATUS_NO_COMMAND_CLEAR = const(0x4801)     # No command to clear, or it was already cleared.
+ANS_STATUS_MAX_TX_REACHED = const(0x6101)       # Failed to test Tx due to the maximum number of transmissions being reached.
+ANS_STATUS_SUCCESS = const(0x7000)
+ANS_STATUS_TIMEOUT = const(0x7001)
+ANS_STATUS_HW_ERR = const(0x7002)
+ANS_STATUS_DATA_SENT = const(0x7003)
+ANS_STATUS_DATA_RECEIVED = const(0x7004)
+ANS_STATUS_PAYLOAD_TOO_LONG = const(0x7005)
+ANS_STATUS_PAYLOAD_ID_CHECK_FAILED = const(0x7006)
+ANS_STATUS_COMMAND_LENGTH_INVALID = const(0x7007)  # Downlink command length is neither 8 nor 40 bytes.
 
 # Satellite search period
-SAT_SEARCH_DEFAULT = 0
-SAT_SEARCH_1377_MS = 1
-SAT_SEARCH_2755_MS = 2
-SAT_SEARCH_4132_MS = 3
-SAT_SEARCH_15150_MS = 4
-SAT_SEARCH_17905_MS = 5
-SAT_SEARCH_23414_MS = 6
+SAT_SEARCH_DEFAULT = const(0)
+SAT_SEARCH_1377_MS = const(1)
+SAT_SEARCH_2755_MS = const(2)
+SAT_SEARCH_4132_MS = const(3)
+SAT_SEARCH_15150_MS = const(4)
+SAT_SEARCH_17905_MS = const(5)
+SAT_SEARCH_23414_MS = const(6)
 
 # Performance counter types
-PER_CMD_LENGTH = 84
-PER_TYPE_SAT_SEARCH_PHASE_CNT = 0x01
-PER_TYPE_SAT_DETECT_OPERATION_CNT = 0x02
-PER_TYPE_SIGNAL_DEMOD_PHASE_CNT = 0x03
-PER_TYPE_SIGNAL_DEMOD_ATTEMPS_CNT = 0x04
-PER_TYPE_SIGNAL_DEMOD_SUCCESS_CNT = 0x05
-PER_TYPE_ACK_DEMOD_ATTEMPT_CNT = 0x06
-PER_TYPE_ACK_DEMOD_SUCCESS_CNT = 0x07
-PER_TYPE_QUEUED_MSG_CNT = 0x08
-PER_TYPE_DEQUEUED_UNACK_MSG_CNT = 0x09
-PER_TYPE_ACK_MSG_CNT = 0x0A
-PER_TYPE_SENT_FRAGMENT_CNT = 0x0B
-PER_TYPE_ACK_FRAGMENT_CNT = 0x0C
-PER_TYPE_CMD_DEMOD_ATTEMPT_CNT = 0x0D
-PER_TYPE_CMD_DEMOD_SUCCESS_CNT = 0x0E
+PER_CMD_LENGTH = const(84)
+PER_TYPE_SAT_SEARCH_PHASE_CNT = const(0x01)
+PER_TYPE_SAT_DETECT_OPERATION_CNT = const(0x02)
+PER_TYPE_SIGNAL_DEMOD_PHASE_CNT = const(0x03)
+PER_TYPE_SIGNAL_DEMOD_ATTEMPS_CNT = const(0x04)
+PER_TYPE_SIGNAL_DEMOD_SUCCESS_CNT = const(0x05)
+PER_TYPE_ACK_DEMOD_ATTEMPT_CNT = const(0x06)
+PER_TYPE_ACK_DEMOD_SUCCESS_CNT = const(0x07)
+PER_TYPE_QUEUED_MSG_CNT = const(0x08)
+PER_TYPE_DEQUEUED_UNACK_MSG_CNT = const(0x09)
+PER_TYPE_ACK_MSG_CNT = const(0x0A)
+PER_TYPE_SENT_FRAGMENT_CNT = const(0x0B)
+PER_TYPE_ACK_FRAGMENT_CNT = const(0x0C)
+PER_TYPE_CMD_DEMOD_ATTEMPT_CNT = const(0x0D)
+PER_TYPE_CMD_DEMOD_SUCCESS_CNT = const(0x0E)
 
 # Module state types
-MST_CMD_LENGTH = 15
-MST_TYPE_MSG_IN_QUEUE = 0x41
-MST_TYPE_ACK_MSG_QUEUE = 0x42
-MST_TYPE_LAST_RST = 0x43
-MST_UPTIME = 0x44
+MST_CMD_LENGTH = const(15)
+MST_TYPE_MSG_IN_QUEUE = const(0x41)
+MST_TYPE_ACK_MSG_QUEUE = const(0x42)
+MST_TYPE_LAST_RST = const(0x43)
+MST_UPTIME = const(0x44)
 
 # Environment details
-END_CMD_LENGTH = 12
-END_TYPE_LAST_MAC_RESULT = 0x61
-END_TYPE_LAST_SAT_SEARCH_PEAK_RSSI = 0x62
-END_TYPE_TIME_SINCE_LAST_SAT_SEARCH = 0x63
+END_CMD_LENGTH = const(12)
+END_TYPE_LAST_MAC_RESULT = const(0x61)
+END_TYPE_LAST_SAT_SEARCH_PEAK_RSSI = const(0x62)
+END_TYPE_TIME_SINCE_LAST_SAT_SEARCH = const(0x63)
 
 # Last contact details
-LCD_CMD_LENGTH = 21
-LCD_TYPE_TIME_START_LAST_CONTACT = 0x51
-LCD_TYPE_TIME_END_LAST_CONTACT = 0x52
-LCD_TYPE_PEAK_RSSI_LAST_CONTACT = 0x53
-LCD_TYPE_TIME_PEAK_RSSI_LAST_CONTACT = 0x54
+LCD_CMD_LENGTH = const(21)
+LCD_TYPE_TIME_START_LAST_CONTACT = const(0x51)
+LCD_TYPE_TIME_END_LAST_CONTACT = const(0x52)
+LCD_TYPE_PEAK_RSSI_LAST_CONTACT = const(0x53)
+LCD_TYPE_TIME_PEAK_RSSI_LAST_CONTACT = const(0x54)
 
 # Events
-EVENT_MSG_ACK = 1      # A satellite payload acknowledgement is available to be read and confirmed
-EVENT_RESET = 2        # Module has reset
-EVENT_CMD_RECEIVED = 3 # A command is available to be read and confirmed
-EVENT_MSG_PENDING = 4  # An uplink message is present in the message queue, waiting to be sent, and module power should not be cut.
-EVENT_NO_EVENT = 0
+EVENT_MSG_ACK = const(1)      # A satellite payload acknowledgement is available to be read and confirmed
+EVENT_RESET = const(2)        # Module has reset
+EVENT_CMD_RECEIVED = const(3) # A command is available to be read and confirmed
+EVENT_MSG_PENDING = const(4)  # An uplink message is present in the message queue, waiting to be sent, and module power should not be cut.
+EVENT_NO_EVENT = const(0)
 
 # Device type
-TYPE_ASTRONODE_S = 3
-TYPE_WIFI_DEVKIT = 4
+TYPE_ASTRONODE_S = const(3)
+TYPE_WIFI_DEVKIT = const(4)
 
 # Data commands (downlink)
-DATA_CMD_8B_SIZE = 8
-DATA_CMD_40B_SIZE = 40
+DATA_CMD_8B_SIZE = const(8)
+DATA_CMD_40B_SIZE = const(40)
 
 # Astrocast time
-ASTROCAST_REF_UNIX_TIME = 1514764800 # 2018-01-01T00:00:00Z (= Astrocast time)
+ASTROCAST_REF_UNIX_TIME = const(1514764800) # 2018-01-01T00:00:00Z (= Astrocast time)
+
+# CRC-16 (CCITT) lookup table, one entry per byte value
+_CRC16_TABLE = (
+    0x0000, 0x1021, 0x2042, 0x3063, 0x4084, 0x50A5, 0x60C6, 0x70E7, 0x8108, 0x9129, 0xA14A, 0xB16B, 0xC18C, 0xD1AD, 0xE1CE, 0xF1EF,
+    0x1231, 0x0210, 0x3273, 0x2252, 0x52B5, 0x4294, 0x72F7, 0x62D6, 0x9339, 0x8318, 0xB37B, 0xA35A, 0xD3BD, 0xC39C, 0xF3FF, 0xE3DE,
+    0x2462, 0x3443, 0x0420, 0x1401, 0x64E6, 0x74C7, 0x44A4, 0x5485, 0xA56A, 0xB54B, 0x8528, 0x9509, 0xE5EE, 0xF5CF, 0xC5AC, 0xD58D,
+    0x3653, 0x2672, 0x1611, 0x0630, 0x76D7, 0x66F6, 0x5695, 0x46B4, 0xB75B, 0xA77A, 0x9719, 0x8738, 0xF7DF, 0xE7FE, 0xD79D, 0xC7BC,
+    0x48C4, 0x58E5, 0x6886, 0x78A7, 0x0840, 0x1861, 0x2802, 0x3823, 0xC9CC, 0xD9ED, 0xE98E, 0xF9AF, 0x8948, 0x9969, 0xA90A, 0xB92B,
+    0x5AF5, 0x4AD4, 0x7AB7, 0x6A96, 0x1A71, 0x0A50, 0x3A33, 0x2A12, 0xDBFD, 0xCBDC, 0xFBBF, 0xEB9E, 0x9B79, 0x8B58, 0xBB3B, 0xAB1A,
+    0x6CA6, 0x7C87, 0x4CE4, 0x5CC5, 0x2C22, 0x3C03, 0x0C60, 0x1C41, 0xEDAE, 0xFD8F, 0xCDEC, 0xDDCD, 0xAD2A, 0xBD0B, 0x8D68, 0x9D49,
+    0x7E97, 0x6EB6, 0x5ED5, 0x4EF4, 0x3E13, 0x2E32, 0x1E51, 0x0E70, 0xFF9F, 0xEFBE, 0xDFDD, 0xCFFC, 0xBF1B, 0xAF3A, 0x9F59, 0x8F78,
+    0x9188, 0x81A9, 0xB1CA, 0xA1EB, 0xD10C, 0xC12D, 0xF14E, 0xE16F, 0x1080, 0x00A1, 0x30C2, 0x20E3, 0x5004, 0x4025, 0x7046, 0x6067,
+    0x83B9, 0x9398, 0xA3FB, 0xB3DA, 0xC33D, 0xD31C, 0xE37F, 0xF35E, 0x02B1, 0x1290, 0x22F3, 0x32D2, 0x4235, 0x5214, 0x6277, 0x7256,
+    0xB5EA, 0xA5CB, 0x95A8, 0x8589, 0xF56E, 0xE54F, 0xD52C, 0xC50D, 0x34E2, 0x24C3, 0x14A0, 0x0481, 0x7466, 0x6447, 0x5424, 0x4405,
+    0xA7DB, 0xB7FA, 0x8799, 0x97B8, 0xE75F, 0xF77E, 0xC71D, 0xD73C, 0x26D3, 0x36F2, 0x0691, 0x16B0, 0x6657, 0x7676, 0x4615, 0x5634,
+    0xD94C, 0xC96D, 0xF90E, 0xE92F, 0x99C8, 0x89E9, 0xB98A, 0xA9AB, 0x5844, 0x4865, 0x7806, 0x6827, 0x18C0, 0x08E1, 0x3882, 0x28A3,
+    0xCB7D, 0xDB5C, 0xEB3F, 0xFB1E, 0x8BF9, 0x9BD8, 0xABBB, 0xBB9A, 0x4A75, 0x5A54, 0x6A37, 0x7A16, 0x0AF1, 0x1AD0, 0x2AB3, 0x3A92,
+    0xFD2E, 0xED0F, 0xDD6C, 0xCD4D, 0xBDAA, 0xAD8B, 0x9DE8, 0x8DC9, 0x7C26, 0x6C07, 0x5C64, 0x4C45, 0x3CA2, 0x2C83, 0x1CE0, 0x0CC1,
+    0xEF1F, 0xFF3E, 0xCF5D, 0xDF7C, 0xAF9B, 0xBFBA, 0x8FD9, 0x9FF8, 0x6E17, 0x7E36, 0x4E55, 0x5E74, 0x2E93, 0x3EB2, 0x0ED1, 0x1EF0
+)
+
+if is_micropython:
+    import micropython
+
+    # Table packed as 256 little-endian 16-bit words so the viper code can
+    # read it through a ptr16 view
+    _CRC16_TABLE_LE = struct.pack("<256H", *_CRC16_TABLE)
+
+    @micropython.viper
+    def _crc16_viper(data, length: int) -> int:
+        buf = ptr8(data)
+        tbl = ptr16(_CRC16_TABLE_LE)
+        crc = 0xFFFF
+        for i in range(length):
+            crc = ((crc << 8) ^ tbl[((crc >> 8) ^ buf[i]) & 0xFF]) & 0xFFFF
+        return crc
+
+    def _crc16(data):
+        '''
+        CRC-16 (CCITT) over raw bytes, native code path
+        '''
+        return _crc16_viper(data, len(data))
+else:
+    def _crc16(data):
+        '''
+        CRC-16 (CCITT) implemented with a precomputed lookup table
+        '''
+        tbl = _CRC16_TABLE
+        crc = 0xFFFF
+        for byte in data:
+            crc = (crc << 8) ^ tbl[(crc >> 8) ^ byte]
+            crc &= 0xFFFF                                   # important, crc must stay 16bits all the way through
+        return crc
+
+    # On hosts with numba available (test harnesses, bulk log decoding),
+    # JIT-compile the loop instead of interpreting it
+    try:
+        from numba import njit
+        import numpy
+
+        _CRC16_TABLE_NP = numpy.array(_CRC16_TABLE, numpy.uint16)
+
+        @njit(cache=True)
+        def _crc16_nb(data, table):
+            crc = 0xFFFF
+            for byte in data:
+                crc = ((crc << 8) ^ table[(crc >> 8) ^ byte]) & 0xFFFF
+            return crc
+
+        def _crc16(data):
+            '''
+            CRC-16 (CCITT) over raw bytes, numba JIT path
+            '''
+            return int(_crc16_nb(numpy.frombuffer(data, numpy.uint8), _CRC16_TABLE_NP))
+    except ImportError:
+        pass
+
+def _build_frame(opcode, data=b''):
+    frame = bytes([opcode]) + data
+    frame += struct.pack('<H', _crc16(frame)) # CRC is sent little-endian
+    return STX + binascii.hexlify(frame).upper() + ETX
+
+# Frames for requests carrying no payload are fully constant, so build them
+# once at import time instead of hexlifying and CRCing on every call
+_EMPTY_FRAMES = {opcode: _build_frame(opcode) for opcode in (
+    CFG_SR, CFG_FR, CFG_RR, RTC_RR, NCO_RR, MGI_RR, MSN_RR, MPN_RR,
+    PLD_DR, PLD_FR, SAK_RR, SAK_CR, CMD_RR, CMD_CR, RES_CR, EVT_RR,
+    CTX_SR, PER_RR, PER_CR, MST_RR, LCD_RR, END_RR
+)}
+
+# Answer opcode expected for each request opcode
+_ANSWER_OPCODE = {
+    CFG_WR: CFG_WA,
+    WIF_WR: WIF_WA,
+    SSC_WR: SSC_WA,
+    CFG_SR: CFG_SA,
+    CFG_FR: CFG_FA,
+    CFG_RR: CFG_RA,
+    RTC_RR: RTC_RA,
+    NCO_RR: NCO_RA,
+    MGI_RR: MGI_RA,
+    MSN_RR: MSN_RA,
+    MPN_RR: MPN_RA,
+    PLD_ER: PLD_EA,
+    PLD_DR: PLD_DA,
+    PLD_FR: PLD_FA,
+    GEO_WR: GEO_WA,
+    SAK_RR: SAK_RA,
+    SAK_CR: SAK_CA,
+    CMD_RR: CMD_RA,
+    CMD_CR: CMD_CA,
+    RES_CR: RES_CA,
+    EVT_RR: EVT_RA,
+    CTX_SR: CTX_SA,
+    PER_RR: PER_RA,
+    PER_CR: PER_CA,
+    MST_RR: MST_RA,
+    LCD_RR: LCD_RA,
+    END_RR: END_RA
+}
+
+def _parse_configuration(data):
+    config = ASTRONODE.ASTRONODE_CONFIG()
+    (config.product_id,
+     config.hardware_rev,
+     config.firmware_maj_ver,
+     config.firmware_min_ver,
+     config.firmware_rev,
+     flags1,
+     _,
+     flags2) = struct.unpack_from("<8B", data)
+    config.with_pl_ack = (flags1 & (1 << 0))
+    config.with_geoloc = (flags1 & (1 << 1))
+    config.with_ephemeris = (flags1 & (1 << 2))
+    config.with_deep_sleep_en = (flags1 & (1 << 3))
+    config.with_msg_ack_pin_en = (flags2 & (1 << 0))
+    config.with_msg_reset_pin_en = (flags2 & (1 << 1))
+    return config
+
+def _parse_ascii(data):
+    return data.decode('ascii').strip().strip('\x00')
+
+def _parse_rtc(data):
+    (time_tmp,) = struct.unpack("<L", data)
+    return time_tmp + ASTROCAST_REF_UNIX_TIME
+
+def _parse_delay(data):
+    (delay,) = struct.unpack("<L", data)
+    return delay
+
+# bytes.hex() (CPython and recent MicroPython ports) skips the intermediate
+# bytes object that hexlify().decode() allocates
+if hasattr(b'', 'hex'):
+    def _hexstr(data):
+        return data.hex()
+else:
+    def _hexstr(data):
+        return binascii.hexlify(data).decode('ascii')
+
+def _parse_message_id(data):
+    return _hexstr(data)
+
+def _parse_performance_counters(data):
+    per_struct = ASTRONODE.ASTRONODE_PER_STRUCT()
+
+    i = 0
+    while i < len(data):
+        type = data[i]
+        length = data[i+1]
+
+        if type == PER_TYPE_SAT_SEARCH_PHASE_CNT:
+            (per_struct.sat_search_phase_cnt,) = struct.unpack_from("L", data, i+2)
+        elif type == PER_TYPE_SAT_DETECT_OPERATION_CNT:
+            (per_struct.sat_detect_operation_cnt,) = struct.unpack_from("L", data, i+2)
+        elif type == PER_TYPE_SIGNAL_DEMOD_PHASE_CNT:
+            (per_struct.signal_demod_phase_cnt,) = struct.unpack_from("L", data, i+2)
+        elif type == PER_TYPE_SIGNAL_DEMOD_ATTEMPS_CNT:
+            (per_struct.signal_demod_attempt_cnt,) = struct.unpack_from("L", data, i+2)
+        elif type == PER_TYPE_SIGNAL_DEMOD_SUCCESS_CNT:
+            (per_struct.signal_demod_success_cnt,) = struct.unpack_from("L", data, i+2)
+        elif type == PER_TYPE_ACK_DEMOD_ATTEMPT_CNT:
+            (per_struct.ack_demod_attempt_cnt,) = struct.unpack_from("L", data, i+2)
+        elif type == PER_TYPE_ACK_DEMOD_SUCCESS_CNT:
+            (per_struct.ack_demod_success_cnt,) = struct.unpack_from("L", data, i+2)
+        elif type == PER_TYPE_QUEUED_MSG_CNT:
+            (per_struct.queued_msg_cnt,) = struct.unpack_from("L", data, i+2)
+        elif type == PER_TYPE_DEQUEUED_UNACK_MSG_CNT:
+            (per_struct.dequeued_unack_msg_cnt,) = struct.unpack_from("L", data, i+2)
+        elif type == PER_TYPE_ACK_MSG_CNT:
+            (per_struct.ack_msg_cnt,) = struct.unpack_from("L", data, i+2)
+        elif type == PER_TYPE_SENT_FRAGMENT_CNT:
+            (per_struct.sent_fragment_cnt,) = struct.unpack_from("L", data, i+2)
+        elif type == PER_TYPE_ACK_FRAGMENT_CNT:
+            (per_struct.ack_fragment_cnt,) = struct.unpack_from("L", data, i+2)
+        elif type == PER_TYPE_CMD_DEMOD_ATTEMPT_CNT:
+            (per_struct.cmd_demod_attempt_cnt,) = struct.unpack_from("L", data, i+2)
+        elif type == PER_TYPE_CMD_DEMOD_SUCCESS_CNT:
+            (per_struct.cmd_demod_success_cnt,) = struct.unpack_from("L", data, i+2)
+
+        i += (2 + length)
+    return per_struct
+
+def _parse_module_state(data):
+    module_state = ASTRONODE.ASTRONODE_MST_STRUCT()
+
+    i = 0
+    while i < len(data):
+        type = data[i]
+        length = data[i+1]
+
+        if type == MST_TYPE_MSG_IN_QUEUE:
+            (module_state.msg_in_queue,) = struct.unpack_from("B", data, i+2)
+        elif type == MST_TYPE_ACK_MSG_QUEUE:
+            (module_state.ack_msg_in_queue,) = struct.unpack_from("B", data, i+2)
+        elif type == MST_TYPE_LAST_RST:
+            (module_state.last_rst,) = struct.unpack_from("B", data, i+2)
+        elif type == MST_UPTIME:
+            (module_state.uptime ,) = struct.unpack_from("L", data, i+2)
+        i += (2 + length)
+    return module_state
+
+def _parse_environment_details(data):
+    env_details = ASTRONODE.ASTRONODE_END_STRUCT()
+
+    i = 0
+    while i < len(data):
+        type = data[i]
+        length = data[i+1]
+
+        if type == END_TYPE_LAST_MAC_RESULT:
+            (env_details.last_mac_result,) = struct.unpack_from("B", data, i+2)
+        elif type == END_TYPE_LAST_SAT_SEARCH_PEAK_RSSI:
+            (env_details.last_sat_search_peak_rssi,) = struct.unpack_from("B", data, i+2)
+        elif type == END_TYPE_TIME_SINCE_LAST_SAT_SEARCH:
+            (env_details.time_since_last_sat_search,) = struct.unpack_from("L", data, i+2)
+        i += (2 + length)
+    return env_details
+
+def _parse_last_contact_details(data):
+    lcd_details = ASTRONODE.ASTRONODE_LCD_STRUCT()
+
+    i = 0
+    while i < len(data):
+        type = data[i]
+        length = data[i+1]
+
+        if type == LCD_TYPE_TIME_START_LAST_CONTACT:
+            (lcd_details.time_start_last_contact,) = struct.unpack_from("L", data, i+2)
+        elif type == LCD_TYPE_TIME_END_LAST_CONTACT:
+            (lcd_details.time_end_last_contact,) = struct.unpack_from("L", data, i+2)
+        elif type == LCD_TYPE_PEAK_RSSI_LAST_CONTACT:
+            (lcd_details.peak_rssi_last_contact,) = struct.unpack_from("B", data, i+2)
+        elif type == LCD_TYPE_TIME_PEAK_RSSI_LAST_CONTACT:
+            (lcd_details.time_peak_rssi_last_contact,) = struct.unpack_from("L", data, i+2)
+        i += (2 + length)
+    return lcd_details
+
+# Decoder for each answer opcode carrying data; answers without an entry just
+# acknowledge the request
+_PARSERS = {
+    CFG_RA: _parse_configuration,
+    MGI_RA: _parse_ascii,
+    MSN_RA: _parse_ascii,
+    MPN_RA: _parse_ascii,
+    RTC_RA: _parse_rtc,
+    NCO_RA: _parse_delay,
+    PLD_DA: _parse_message_id,
+    SAK_RA: _parse_message_id,
+    PER_RA: _parse_performance_counters,
+    MST_RA: _parse_module_state,
+    END_RA: _parse_environment_details,
+    LCD_RA: _parse_last_contact_details
+}
 
 class ASTRONODE:
     def __init__(self, module_tx, module_rx, module_serial_port_name=None):
         self._serialPort = None
         self._debug_on = False
+        self._msg_id = random.getrandbits(16)
 
         if module_tx is not None and module_rx is not None and is_micropython:
             self._serialPort = UART(1, 9600, tx=module_tx, rx=module_rx)
@@ -213,72 +503,35 @@ class ASTRONODE:
                                 inter_byte_timeout = 0.001
                             )
 
-    def _crc16(self, data):
-        '''
-        CRC-16 (CCITT) implemented with a precomputed lookup table
-        '''
-        table = [
-            0x0000, 0x1021, 0x2042, 0x3063, 0x4084, 0x50A5, 0x60C6, 0x70E7, 0x8108, 0x9129, 0xA14A, 0xB16B, 0xC18C, 0xD1AD, 0xE1CE, 0xF1EF,
-            0x1231, 0x0210, 0x3273, 0x2252, 0x52B5, 0x4294, 0x72F7, 0x62D6, 0x9339, 0x8318, 0xB37B, 0xA35A, 0xD3BD, 0xC39C, 0xF3FF, 0xE3DE,
-            0x2462, 0x3443, 0x0420, 0x1401, 0x64E6, 0x74C7, 0x44A4, 0x5485, 0xA56A, 0xB54B, 0x8528, 0x9509, 0xE5EE, 0xF5CF, 0xC5AC, 0xD58D,
-            0x3653, 0x2672, 0x1611, 0x0630, 0x76D7, 0x66F6, 0x5695, 0x46B4, 0xB75B, 0xA77A, 0x9719, 0x8738, 0xF7DF, 0xE7FE, 0xD79D, 0xC7BC,
-            0x48C4, 0x58E5, 0x6886, 0x78A7, 0x0840, 0x1861, 0x2802, 0x3823, 0xC9CC, 0xD9ED, 0xE98E, 0xF9AF, 0x8948, 0x9969, 0xA90A, 0xB92B,
-            0x5AF5, 0x4AD4, 0x7AB7, 0x6A96, 0x1A71, 0x0A50, 0x3A33, 0x2A12, 0xDBFD, 0xCBDC, 0xFBBF, 0xEB9E, 0x9B79, 0x8B58, 0xBB3B, 0xAB1A,
-            0x6CA6, 0x7C87, 0x4CE4, 0x5CC5, 0x2C22, 0x3C03, 0x0C60, 0x1C41, 0xEDAE, 0xFD8F, 0xCDEC, 0xDDCD, 0xAD2A, 0xBD0B, 0x8D68, 0x9D49,
-            0x7E97, 0x6EB6, 0x5ED5, 0x4EF4, 0x3E13, 0x2E32, 0x1E51, 0x0E70, 0xFF9F, 0xEFBE, 0xDFDD, 0xCFFC, 0xBF1B, 0xAF3A, 0x9F59, 0x8F78,
-            0x9188, 0x81A9, 0xB1CA, 0xA1EB, 0xD10C, 0xC12D, 0xF14E, 0xE16F, 0x1080, 0x00A1, 0x30C2, 0x20E3, 0x5004, 0x4025, 0x7046, 0x6067,
-            0x83B9, 0x9398, 0xA3FB, 0xB3DA, 0xC33D, 0xD31C, 0xE37F, 0xF35E, 0x02B1, 0x1290, 0x22F3, 0x32D2, 0x4235, 0x5214, 0x6277, 0x7256,
-            0xB5EA, 0xA5CB, 0x95A8, 0x8589, 0xF56E, 0xE54F, 0xD52C, 0xC50D, 0x34E2, 0x24C3, 0x14A0, 0x0481, 0x7466, 0x6447, 0x5424, 0x4405,
-            0xA7DB, 0xB7FA, 0x8799, 0x97B8, 0xE75F, 0xF77E, 0xC71D, 0xD73C, 0x26D3, 0x36F2, 0x0691, 0x16B0, 0x6657, 0x7676, 0x4615, 0x5634,
-            0xD94C, 0xC96D, 0xF90E, 0xE92F, 0x99C8, 0x89E9, 0xB98A, 0xA9AB, 0x5844, 0x4865, 0x7806, 0x6827, 0x18C0, 0x08E1, 0x3882, 0x28A3,
-            0xCB7D, 0xDB5C, 0xEB3F, 0xFB1E, 0x8BF9, 0x9BD8, 0xABBB, 0xBB9A, 0x4A75, 0x5A54, 0x6A37, 0x7A16, 0x0AF1, 0x1AD0, 0x2AB3, 0x3A92,
-            0xFD2E, 0xED0F, 0xDD6C, 0xCD4D, 0xBDAA, 0xAD8B, 0x9DE8, 0x8DC9, 0x7C26, 0x6C07, 0x5C64, 0x4C45, 0x3CA2, 0x2C83, 0x1CE0, 0x0CC1,
-            0xEF1F, 0xFF3E, 0xCF5D, 0xDF7C, 0xAF9B, 0xBFBA, 0x8FD9, 0x9FF8, 0x6E17, 0x7E36, 0x4E55, 0x5E74, 0x2E93, 0x3EB2, 0x0ED1, 0x1EF0
-        ]
-
-        crc = 0xFFFF
-        for byte in data:
-            crc = (crc << 8) ^ table[(crc >> 8) ^ byte]
-            crc &= 0xFFFF                                   # important, crc must stay 16bits all the way through
-        return crc
-
-    def _generate_crc(self, data):
-        crc_tmp = '{:04X}'.format(self._crc16(binascii.unhexlify(data)))
-        crc = crc_tmp[2]
-        crc += crc_tmp[3]
-        crc += crc_tmp[0]
-        crc += crc_tmp[1]
-        return crc
-
     def _ljust(self, byte_array, size):
         byte_array_size = len(byte_array)
         if size > byte_array_size:
             byte_array += b'\x00' * (size - byte_array_size)
         return byte_array
 
-    def _text_to_hex(self, text):
-        return binascii.hexlify(text).decode('ascii')
-
     def _generate_message(self, payload, include_message_id=False, id=None):
-        m = ''
+        m = b''
         if include_message_id:
-            id = id if id is not None else ('{:04s}'.format((hex(random.randint(0, 65535)))[2:6]))
-            m = id
-        m += self._text_to_hex(payload)
+            if id is None:
+                # IDs only need to be unique per session: a 16-bit counter
+                # seeded randomly once is cheaper than a PRNG call per message
+                self._msg_id = (self._msg_id + 1) & 0xFFFF
+                id = '%04x' % self._msg_id
+            m = binascii.unhexlify(id)
+        if isinstance(payload, str):
+            payload = payload.encode()
+        m += payload
         return (id, m)
 
-    def _encode_send_request(self, opcode, data=""):
-        msg = "%0.2X" % opcode
-        msg += data
-        crc = self._generate_crc(msg)
-        msg += crc
-        msg = binascii.hexlify(msg.encode())
-        msg = self._text_to_hex(STX) + msg.decode()
-        msg += self._text_to_hex(ETX)
+    def _encode_send_request(self, opcode, data=b''):
+        if data:
+            msg = _build_frame(opcode, data)
+        else:
+            msg = _EMPTY_FRAMES.get(opcode)
+            if msg is None:
+                msg = _build_frame(opcode)
         if self._debug_on:
             print(">: {}".format(msg))
-        msg = binascii.unhexlify(msg)
-        msg = msg.upper()
 
         message_len = self._serialPort.write(msg)
         if message_len is not None:
@@ -287,47 +540,69 @@ class ASTRONODE:
             return ANS_STATUS_HW_ERR
 
     def _receive_decode_answer(self):
-        message_buffer = b''
+        message_buffer = bytearray()
         ret_status = ANS_STATUS_NONE
         opcode = None
         data = None
 
-        start_timestamp = now_ms()
-        timeout_timestamp = start_timestamp + 1000
+        # Bind the names used on every iteration to locals; on MicroPython a
+        # local access is much cheaper than a global or attribute lookup
+        _now_ms = now_ms
+        _ticks_diff = ticks_diff
+        port = self._serialPort
+        _read = port.read
+        stx = STX
+        etx = ETX
+
+        # ticks_ms() wraps on MicroPython, so the deadline must be handled
+        # with ticks_add/ticks_diff rather than plain arithmetic
+        deadline = ticks_add(_now_ms(), 1000)
         do_capture = False
         while True:
-            if(now_ms() >= timeout_timestamp):
+            if _ticks_diff(deadline, _now_ms()) <= 0:
                 break
 
-            if (is_micropython and self._serialPort.any()) or not is_micropython:
-                b = self._serialPort.read(1)
-                if b == STX:
-                    do_capture = True
-                    message_buffer = b''
+            # Read everything the driver has buffered in one call instead of
+            # going through the UART plumbing once per byte
+            if is_micropython:
+                available = port.any()
+            else:
+                available = port.in_waiting
+
+            if available:
+                # extend() appends in place, avoiding the O(N^2) reallocation
+                # pattern of growing an immutable bytes object
+                message_buffer.extend(_read(available))
+
+                if not do_capture:
+                    i = message_buffer.find(stx)
+                    if i >= 0:
+                        # Discard anything received before the start of frame
+                        del message_buffer[:i]
+                        do_capture = True
+                    else:
+                        del message_buffer[:]
 
                 if do_capture:
-                    message_buffer += b
-
-                if b == ETX:
-                    break
-                continue
-            sleep_ms(1)
+                    i = message_buffer.find(etx, 1)
+                    if i >= 0:
+                        del message_buffer[i + 1:]
+                        break
 
         if self._debug_on:
-            print("<: {}".format(message_buffer))
+            print("<: {}".format(bytes(message_buffer)))
 
         if len(message_buffer) > 6: # At least STX (1), ETX (1), CRC (4)
-            message = message_buffer[1:-5].decode() # [STX (1), - (CRC (4) + ETX (1))]
-            cmd_crc_check = message_buffer[-5:-1].decode()
-            com_buf_astronode = binascii.unhexlify(message)
+            com_buf_astronode = binascii.unhexlify(message_buffer[1:-5]) # [STX (1), - (CRC (4) + ETX (1))]
+            (cmd_crc_check,) = struct.unpack('<H', binascii.unhexlify(message_buffer[-5:-1]))
 
             # Verify CRC
-            cmd_crc = self._generate_crc(message)
+            cmd_crc = _crc16(com_buf_astronode)
 
             if cmd_crc == cmd_crc_check:
                 if com_buf_astronode[0] == ERR_RA:
                     # Process error code from terminal
-                    ret_status = ((com_buf_astronode[2] << 8) + com_buf_astronode[1])
+                    (ret_status,) = struct.unpack_from('<H', com_buf_astronode, 1)
                 else:
                     # Extract parameters
                     data = com_buf_astronode[1:]
@@ -345,7 +620,7 @@ class ASTRONODE:
             print("ret_status: {}, opcode: {}, data: {}".format(hex(ret_status), hex(opcode) if opcode is not None else opcode, data))
         return (ret_status, opcode, data)
 
-    def send_cmd(self, reg_req, reg_ans, params=""):
+    def send_cmd(self, reg_req, reg_ans, params=b''):
         ret_data = None
         ret_status = self._encode_send_request(reg_req, params)
         if ret_status == ANS_STATUS_DATA_SENT:
@@ -354,6 +629,18 @@ class ASTRONODE:
                 ret_data = data
         return (ret_status, ret_data)
 
+    def _exchange(self, reg_req, params=b''):
+        '''
+        Send a request, validate the answer opcode and decode the answer
+        data with the parser registered for it (if any)
+        '''
+        reg_ans = _ANSWER_OPCODE[reg_req]
+        (status, data) = self.send_cmd(reg_req, reg_ans, params)
+        if status == ANS_STATUS_DATA_RECEIVED:
+            parser = _PARSERS.get(reg_ans)
+            return (ANS_STATUS_SUCCESS, parser(data) if parser is not None else None)
+        return (status, None)
+
     def get_error_code_string(code):
         if code == ANS_STATUS_CRC_NOT_VALID:
             return "Discrepancy between provided CRC and expected CRC.\n"
@@ -405,6 +692,11 @@ class ASTRONODE:
             return "Unknown error code.\n"
 
     class ASTRONODE_CONFIG:
+        __slots__ = ('product_id', 'hardware_rev', 'firmware_maj_ver',
+                     'firmware_min_ver', 'firmware_rev', 'with_pl_ack',
+                     'with_geoloc', 'with_ephemeris', 'with_deep_sleep_en',
+                     'with_msg_ack_pin_en', 'with_msg_reset_pin_en')
+
         def __init__(self):
             self.product_id = None
             self.hardware_rev = None
@@ -419,6 +711,14 @@ class ASTRONODE:
             self.with_msg_reset_pin_en = None
 
     class ASTRONODE_PER_STRUCT:
+        __slots__ = ('sat_search_phase_cnt', 'sat_detect_operation_cnt',
+                     'signal_demod_phase_cnt', 'signal_demod_attempt_cnt',
+                     'signal_demod_success_cnt', 'ack_demod_attempt_cnt',
+                     'ack_demod_success_cnt', 'queued_msg_cnt',
+                     'dequeued_unack_msg_cnt', 'ack_msg_cnt',
+                     'sent_fragment_cnt', 'ack_fragment_cnt',
+                     'cmd_demod_attempt_cnt', 'cmd_demod_success_cnt')
+
         def __init__(self):
             self.sat_search_phase_cnt = 0
             self.sat_detect_operation_cnt = 0
@@ -436,6 +736,8 @@ class ASTRONODE:
             self.cmd_demod_success_cnt = 0
 
     class ASTRONODE_MST_STRUCT:
+        __slots__ = ('msg_in_queue', 'ack_msg_in_queue', 'last_rst', 'uptime')
+
         def __init__(self):
             self.msg_in_queue = None
             self.ack_msg_in_queue = None
@@ -443,12 +745,18 @@ class ASTRONODE:
             self.uptime = None
 
     class ASTRONODE_END_STRUCT:
+        __slots__ = ('last_mac_result', 'last_sat_search_peak_rssi',
+                     'time_since_last_sat_search')
+
         def __init__(self):
             self.last_mac_result = None
             self.last_sat_search_peak_rssi = None
             self.time_since_last_sat_search = None
 
     class ASTRONODE_LCD_STRUCT:
+        __slots__ = ('time_start_last_contact', 'time_end_last_contact',
+                     'peak_rssi_last_contact', 'time_peak_rssi_last_contact')
+
         def __init__(self):
             self.time_start_last_contact = 0
             self.time_end_last_contact = 0
@@ -456,6 +764,8 @@ class ASTRONODE:
             self.time_peak_rssi_last_contact = 0
 
     class ASTRONODE_DOWNLINK_COMMAND_STRUCT:
+        __slots__ = ('data', 'create_date')
+
         def __init__(self):
             self.data = None
             self.create_date = None
@@ -467,66 +777,31 @@ class ASTRONODE:
         self._debug_on = False
 
     def configuration_write(self, with_pl_ack, with_geoloc, with_ephemeris, with_deep_sleep, with_ack_event_pin_mask, with_reset_event_pin_mask):
-        # Set parameters
-        param_w = bytearray(3)
-
-        if with_pl_ack:
-            param_w[0] |= 1 << 0
-        if with_geoloc:
-            param_w[0] |= 1 << 1
-        if with_ephemeris:
-            param_w[0] |= 1 << 2
-        if with_deep_sleep:
-            param_w[0] |= 1 << 3
-        if with_ack_event_pin_mask:
-            param_w[2] |= 1 << 0
-        if with_reset_event_pin_mask:
-            param_w[2] |= 1 << 1
+        # Pack the six flag bits branchlessly into the 3-byte parameter field
+        param_w = bytes((bool(with_pl_ack)
+                         | (bool(with_geoloc) << 1)
+                         | (bool(with_ephemeris) << 2)
+                         | (bool(with_deep_sleep) << 3),
+                         0,
+                         bool(with_ack_event_pin_mask)
+                         | (bool(with_reset_event_pin_mask) << 1)))
 
         (_, message) = self._generate_message(param_w)
 
-        (status, _) = self.send_cmd(CFG_WR, CFG_WA, message)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            status = ANS_STATUS_SUCCESS
-        return (status, None)
+        return self._exchange(CFG_WR, message)
 
     def configuration_read(self):
-        config = None
-        #Send request
-        (status, data) = self.send_cmd(CFG_RR, CFG_RA)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            config = ASTRONODE.ASTRONODE_CONFIG()
-            config.product_id = data[0]
-            config.hardware_rev = data[1]
-            config.firmware_maj_ver = data[2]
-            config.firmware_min_ver = data[3]
-            config.firmware_rev = data[4]
-            config.with_pl_ack = (data[5] & (1 << 0))
-            config.with_geoloc = (data[5] & (1 << 1))
-            config.with_ephemeris = (data[5] & (1 << 2))
-            config.with_deep_sleep_en = (data[5] & (1 << 3))
-            config.with_msg_ack_pin_en = (data[7] & (1 << 0))
-            config.with_msg_reset_pin_en = (data[7] & (1 << 1))
-
-            ret_status = ANS_STATUS_SUCCESS
-        return (ret_status, config)
+        return self._exchange(CFG_RR)
 
     def configuration_save(self):
-        # Send request
-        (status, _) = self.send_cmd(CFG_SR, CFG_SA)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            status = ANS_STATUS_SUCCESS
-        return (status, None)
+        return self._exchange(CFG_SR)
 
     def wifi_configuration_write(self, wland_ssid, wland_key, auth_token):
         configuration_wifi = self._ljust(wland_ssid.encode(), 33) + \
                      self._ljust(wland_key.encode(), 64) + self._ljust(auth_token.encode(), 97)
 
         (_, message) = self._generate_message(configuration_wifi)
-        (status, _) = self.send_cmd(WIF_WR, WIF_WA, message)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            status = ANS_STATUS_SUCCESS
-        return (status, None)
+        return self._exchange(WIF_WR, message)
 
     # ex:L module.satellite_search_config_write(astronode.SAT_SEARCH_17905_MS)
     def satellite_search_config_write(self, search_period, force_search=False):
@@ -539,204 +814,52 @@ class ASTRONODE:
 
         (_, message) = self._generate_message(param_w)
 
-        (status, _) = self.send_cmd(SSC_WR, SSC_WA, message)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            status = ANS_STATUS_SUCCESS
-        return (status, None)
+        return self._exchange(SSC_WR, message)
 
     # module.geolocation_write(37.9787032,23.7513826)
     def geolocation_write(self, lat, lon):
         # Set parameters
-        status = None
-        param_w = bytearray()
-
-        param_w += struct.pack("i", int(lat * 1E7))
-        param_w += struct.pack("i", int(lon * 1E7))
+        param_w = struct.pack("<ii", int(lat * 1E7), int(lon * 1E7))
 
-        if len(param_w) == 8:
-            (_, message) = self._generate_message(param_w)
+        (_, message) = self._generate_message(param_w)
 
-            (status, _) = self.send_cmd(GEO_WR, GEO_WA, message)
-            if status == ANS_STATUS_DATA_RECEIVED:
-                status = ANS_STATUS_SUCCESS
-        return (status, None)
+        return self._exchange(GEO_WR, message)
 
     def factory_reset(self):
-        # Send request
-        (status, _) = self.send_cmd(CFG_FR, CFG_FA)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            status = ANS_STATUS_SUCCESS
-        return (status, None)
+        return self._exchange(CFG_FR)
 
     def guid_read(self):
-        guid = None
-        (status, data) = self.send_cmd(MGI_RR, MGI_RA)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            guid = data
-            status = ANS_STATUS_SUCCESS
-        return (status, guid.decode('ascii').strip().strip('\x00') if guid is not None else None)
+        return self._exchange(MGI_RR)
 
     def serial_number_read(self):
-        sn = None
-        (status, data) = self.send_cmd(MSN_RR, MSN_RA)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            sn = data
-            status = ANS_STATUS_SUCCESS
-        return (status, sn.decode('ascii').strip().strip('\x00') if sn is not None else None)
+        return self._exchange(MSN_RR)
 
     def product_number_read(self):
-        pn = None
-        (status, data) = self.send_cmd(MPN_RR, MPN_RA)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            pn = data
-            status = ANS_STATUS_SUCCESS
-        return (status, pn.decode('ascii').strip().strip('\x00') if pn is not None else None)
+        return self._exchange(MPN_RR)
 
     def rtc_read(self):
-        time = None
-        (status, data) = self.send_cmd(RTC_RR, RTC_RA)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            (time_tmp,) = struct.unpack("<L", data)
-            time = time_tmp + ASTROCAST_REF_UNIX_TIME
-            ret_status = ANS_STATUS_SUCCESS
-        return (ret_status, time)
+        return self._exchange(RTC_RR)
 
     def read_next_contact_opportunity(self):
-        delay = None
-        (status, data) = self.send_cmd(NCO_RR, NCO_RA)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            (delay,) = struct.unpack("<L", data)
-            ret_status = ANS_STATUS_SUCCESS
-        return (ret_status, delay)
+        return self._exchange(NCO_RR)
 
     def read_performance_counter(self):
-        per_struct = None
-        (status, data) = self.send_cmd(PER_RR, PER_RA)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            per_struct = self.ASTRONODE_PER_STRUCT()
-
-            i = 0
-            while i < len(data):
-                type = data[i]
-                length = data[i+1]
-
-                if type == PER_TYPE_SAT_SEARCH_PHASE_CNT:
-                    (per_struct.sat_search_phase_cnt,) = struct.unpack_from("L", data, i+2)
-                elif type == PER_TYPE_SAT_DETECT_OPERATION_CNT:
-                    (per_struct.sat_detect_operation_cnt,) = struct.unpack_from("L", data, i+2)
-                elif type == PER_TYPE_SIGNAL_DEMOD_PHASE_CNT:
-                    (per_struct.signal_demod_phase_cnt,) = struct.unpack_from("L", data, i+2)
-                elif type == PER_TYPE_SIGNAL_DEMOD_ATTEMPS_CNT:
-                    (per_struct.signal_demod_attempt_cnt,) = struct.unpack_from("L", data, i+2)
-                elif type == PER_TYPE_SIGNAL_DEMOD_SUCCESS_CNT:
-                    (per_struct.signal_demod_success_cnt,) = struct.unpack_from("L", data, i+2)
-                elif type == PER_TYPE_ACK_DEMOD_ATTEMPT_CNT:
-                    (per_struct.ack_demod_attempt_cnt,) = struct.unpack_from("L", data, i+2)
-                elif type == PER_TYPE_ACK_DEMOD_SUCCESS_CNT:
-                    (per_struct.ack_demod_success_cnt,) = struct.unpack_from("L", data, i+2)
-                elif type == PER_TYPE_QUEUED_MSG_CNT:
-                    (per_struct.queued_msg_cnt,) = struct.unpack_from("L", data, i+2)
-                elif type == PER_TYPE_DEQUEUED_UNACK_MSG_CNT:
-                    (per_struct.dequeued_unack_msg_cnt,) = struct.unpack_from("L", data, i+2)
-                elif type == PER_TYPE_ACK_MSG_CNT:
-                    (per_struct.ack_msg_cnt,) = struct.unpack_from("L", data, i+2)
-                elif type == PER_TYPE_SENT_FRAGMENT_CNT:
-                    (per_struct.sent_fragment_cnt,) = struct.unpack_from("L", data, i+2)
-                elif type == PER_TYPE_ACK_FRAGMENT_CNT:
-                    (per_struct.ack_fragment_cnt,) = struct.unpack_from("L", data, i+2)
-                elif type == PER_TYPE_CMD_DEMOD_ATTEMPT_CNT:
-                    (per_struct.cmd_demod_attempt_cnt,) = struct.unpack_from("L", data, i+2)
-                elif type == PER_TYPE_CMD_DEMOD_SUCCESS_CNT:
-                    (per_struct.cmd_demod_success_cnt,) = struct.unpack_from("L", data, i+2)
-
-                i += (2 + length)
-            status = ANS_STATUS_SUCCESS
-
-        return (status, per_struct)
+        return self._exchange(PER_RR)
 
     def save_context(self):
-        # Send request
-        (status, _) = self.send_cmd(CTX_SR, CTX_SA)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            status = ANS_STATUS_SUCCESS
-        return (status, None)
+        return self._exchange(CTX_SR)
 
     def clear_performance_counter(self):
-        # Send request
-        (status, _) = self.send_cmd(PER_CR, PER_CA)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            status = ANS_STATUS_SUCCESS
-        return (status, None)
+        return self._exchange(PER_CR)
 
     def read_module_state(self):
-        module_state = None
-        (status, data) = self.send_cmd(MST_RR, MST_RA)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            module_state = self.ASTRONODE_MST_STRUCT()
-
-            i = 0
-            while i < len(data):
-                type = data[i]
-                length = data[i+1]
-
-                if type == MST_TYPE_MSG_IN_QUEUE:
-                    (module_state.msg_in_queue,) = struct.unpack_from("B", data, i+2)
-                elif type == MST_TYPE_ACK_MSG_QUEUE:
-                    (module_state.ack_msg_in_queue,) = struct.unpack_from("B", data, i+2)
-                elif type == MST_TYPE_LAST_RST:
-                    (module_state.last_rst,) = struct.unpack_from("B", data, i+2)
-                elif type == MST_UPTIME:
-                    (module_state.uptime ,) = struct.unpack_from("L", data, i+2)
-                i += (2 + length)
-            status = ANS_STATUS_SUCCESS
-
-        return (status, module_state)
+        return self._exchange(MST_RR)
 
     def read_environment_details(self):
-        env_details = None
-        (status, data) = self.send_cmd(END_RR, END_RA)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            env_details = self.ASTRONODE_END_STRUCT()
-
-            i = 0
-            while i < len(data):
-                type = data[i]
-                length = data[i+1]
-
-                if type == END_TYPE_LAST_MAC_RESULT:
-                    (env_details.last_mac_result,) = struct.unpack_from("B", data, i+2)
-                elif type == END_TYPE_LAST_SAT_SEARCH_PEAK_RSSI:
-                    (env_details.last_sat_search_peak_rssi,) = struct.unpack_from("B", data, i+2)
-                elif type == END_TYPE_TIME_SINCE_LAST_SAT_SEARCH:
-                    (env_details.time_since_last_sat_search,) = struct.unpack_from("L", data, i+2)
-                i += (2 + length)
-            status = ANS_STATUS_SUCCESS
-
-        return (status, env_details)
+        return self._exchange(END_RR)
 
     def read_last_contact_details(self):
-        lcd_details = None
-        (status, data) = self.send_cmd(LCD_RR, LCD_RA)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            lcd_details = self.ASTRONODE_LCD_STRUCT()
-
-            i = 0
-            while i < len(data):
-                type = data[i]
-                length = data[i+1]
-
-                if type == LCD_TYPE_TIME_START_LAST_CONTACT:
-                    (lcd_details.time_start_last_contact,) = struct.unpack_from("L", data, i+2)
-                elif type == LCD_TYPE_TIME_END_LAST_CONTACT:
-                    (lcd_details.time_end_last_contact,) = struct.unpack_from("L", data, i+2)
-                elif type == LCD_TYPE_PEAK_RSSI_LAST_CONTACT:
-                    (lcd_details.peak_rssi_last_contact,) = struct.unpack_from("B", data, i+2)
-                elif type == LCD_TYPE_TIME_PEAK_RSSI_LAST_CONTACT:
-                    (lcd_details.time_peak_rssi_last_contact,) = struct.unpack_from("L", data, i+2)
-                i += (2 + length)
-            status = ANS_STATUS_SUCCESS
-
-        return (status, lcd_details)
+        return self._exchange(LCD_RR)
 
     def enqueue_payload(self, data, id=None):
         status = ANS_STATUS_NONE
@@ -749,7 +872,7 @@ class ASTRONODE:
             (status, data) = self.send_cmd(PLD_ER, PLD_EA, message)
             if status == ANS_STATUS_DATA_RECEIVED:
                 # Check that enqueued payload has the correct ID
-                id_check = binascii.hexlify(data).decode('ascii')
+                id_check = _hexstr(data)
                 if id == id_check:
                     status = ANS_STATUS_SUCCESS
                 else:
@@ -760,20 +883,10 @@ class ASTRONODE:
         return (status, id)
 
     def dequeue_payload(self):
-        id = None
-        # Send request
-        (status, data) = self.send_cmd(PLD_DR, PLD_DA)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            id = binascii.hexlify(data).decode('ascii')
-            status = ANS_STATUS_SUCCESS
-        return (status, id)
+        return self._exchange(PLD_DR)
 
     def clear_free_payloads(self):
-        # Send request
-        (status, _) = self.send_cmd(PLD_FR, PLD_FA)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            status = ANS_STATUS_SUCCESS
-        return (status, None)
+        return self._exchange(PLD_FR)
 
     def read_command(self):
         dl_data = self.ASTRONODE_DOWNLINK_COMMAND_STRUCT()
@@ -791,11 +904,7 @@ class ASTRONODE:
         return (ret_status, dl_data)
 
     def clear_command(self):
-        # Send request
-        (status, _) = self.send_cmd(CMD_CR, CMD_CA)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            status = ANS_STATUS_SUCCESS
-        return (status, None)
+        return self._exchange(CMD_CR)
 
     def event_read(self):
         event_type = EVENT_NO_EVENT
@@ -814,27 +923,13 @@ class ASTRONODE:
         return (status, event_type)
 
     def read_satellite_ack(self):
-        id = None
-        # Send request
-        (status, data) = self.send_cmd(SAK_RR, SAK_RA)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            id = binascii.hexlify(data).decode('ascii')
-            status = ANS_STATUS_SUCCESS
-        return (status, id)
+        return self._exchange(SAK_RR)
 
     def clear_satellite_ack(self):
-        # Send request
-        (status, _) = self.send_cmd(SAK_CR, SAK_CA)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            status = ANS_STATUS_SUCCESS
-        return (status, None)
+        return self._exchange(SAK_CR)
 
     def clear_reset_event(self):
-        # Send request
-        (status, _) = self.send_cmd(RES_CR, RES_CA)
-        if status == ANS_STATUS_DATA_RECEIVED:
-            status = ANS_STATUS_SUCCESS
-        return (status, None)
+        return self._exchange(RES_CR)
 
     def is_alive(self):
         (status, _) = self.send_cmd(0x00, 0x00)